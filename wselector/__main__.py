@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import os
 import sys
+import tracemalloc
 import gi
 
 gi.require_version('Gtk', '4.0')
@@ -10,6 +12,10 @@ from gi.repository import Gio
 from wselector.app import WSelectorApp
 
 def main():
+    # Allocation tracing slows every allocation down, so it is opt-in only
+    if os.environ.get("WSELECTOR_TRACEMALLOC"):
+        tracemalloc.start(int(os.environ.get("WSELECTOR_TRACEMALLOC_FRAMES", "1")))
+
     app = WSelectorApp(
         application_id="io.github.Cookiiieee.WSelector",
         flags=Gio.ApplicationFlags.DEFAULT_FLAGS
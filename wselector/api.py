@@ -1,5 +1,8 @@
 import logging
 import requests
+from urllib.parse import urlencode, quote_plus
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Optional
 from wselector.models import WallpaperInfo
 
@@ -10,6 +13,41 @@ class WSelectorScraper:
     """Handles interaction with the Wallhaven API for WSelector."""
     
     BASE_URL = "https://wallhaven.cc/api/v1"
+    USER_AGENT = "WSelector (+https://github.com/Cookiiieee/WSelector)"
+    REQUEST_TIMEOUT = 10  # Seconds
+    
+    def __init__(self):
+        # One pooled session keeps DNS, TCP and TLS state alive across searches
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = self.USER_AGENT
+        
+        # Search URL prefix for the current filters; only query and page vary per call
+        self._search_url = (None, None)  # (filters, encoded URL prefix)
+    
+    def _get_search_url_prefix(self, categories: str, purity: str, sort_param: str,
+                               resolution: Optional[str]) -> str:
+        """Return the encoded search URL for these filters, rebuilding it only when they change."""
+        key = (categories, purity, sort_param, resolution)
+        cached_key, prefix = self._search_url
+        if key != cached_key:
+            params = {
+                'categories': categories,
+                'purity': purity,
+                'sorting': sort_param,
+                'order': 'desc' if sort_param != 'random' else 'asc',
+            }
+            # Use 'atleast' instead of 'resolutions' to get wallpapers that are at least this size
+            if resolution:
+                params['atleast'] = resolution
+            prefix = f"{self.BASE_URL}/search?{urlencode(params)}"
+            self._search_url = (key, prefix)
+        return prefix
     
     def search_wallpapers(self, query: Optional[str] = None, categories: str = "111", 
                          purity: str = "100", page: int = 1, sort: str = "latest",
@@ -47,45 +85,16 @@ class WSelectorScraper:
             # Default to 'date_added' if sort mode is not recognized
             sort_param = sort_mapping.get(sort.lower(), 'date_added')
         
-        # Initialize params with common parameters
-        params = {
-            'categories': categories,
-            'purity': purity,
-            'sorting': sort_param,
-            'order': 'desc' if sort_param != 'random' else 'asc',
-            'page': str(page)  # Convert page number to string for the API
-        }
-        
-        # Add search query if provided (it will be properly URL-encoded by requests)
-        if query and query.strip():
-            params['q'] = query.strip()
-            
-        # Add resolution filter if provided
-        if resolution:
-            # Use 'atleast' parameter instead of 'resolutions' to get wallpapers that are at least this size
-            # This gives more results than the exact resolution match
-            params['atleast'] = resolution
-        
         try:
-            # Create a custom ordered params dictionary to put query first
-            ordered_params = {}
-            
-            # Add query first if it exists
-            if 'q' in params:
-                ordered_params['q'] = params['q']
-                
-            # Add all other parameters
-            for key, value in params.items():
-                if key != 'q':
-                    ordered_params[key] = value
-            
-            # Log the full URL with parameters in the desired order
-            from urllib.parse import urlencode
-            full_url = f"{self.BASE_URL}/search?{urlencode(ordered_params, doseq=True)}"
-            logger.info(f"Making API request to: {full_url}")
+            # Only the query and page change between calls, so append them to
+            # the cached prefix instead of re-encoding every parameter
+            url = self._get_search_url_prefix(categories, purity, sort_param, resolution)
+            if query and query.strip():
+                url += f"&q={quote_plus(query.strip())}"
+            url += f"&page={page}"
+            logger.info(f"Making API request to: {url}")
             
-            # Use the ordered params for the actual request
-            response = requests.get(f"{self.BASE_URL}/search", params=ordered_params)
+            response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
 
@@ -3,6 +3,8 @@
 import sys
 import os
 import logging
+import logging.handlers
+import queue
 import json
 import threading
 import time
@@ -10,10 +12,19 @@ import urllib.request
 import subprocess
 import concurrent.futures
 import tempfile
+import collections
+import itertools
+import gc
+import tracemalloc
 import gi
 from datetime import datetime
 import psutil
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 gi.require_version('Gdk', '4.0')
@@ -24,23 +35,53 @@ from gi.repository import GLib, Gtk, Gio, Adw, Gdk, GdkPixbuf, Pango, GObject
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from wselector.models import WallpaperInfo, WallpaperGObject
+from wselector.models import WallpaperInfo, WallpaperGObject, CACHE_DIR
 from wselector.api import WSelectorScraper
-from wselector.utils import download_thumbnail, check_memory_usage, manual_cleanup
+from wselector.utils import download_thumbnail, check_memory_usage, manual_cleanup, get_rss_mb, BYTES_TO_MB
+
+# Configuration paths, resolved once at import
+CONFIG_PATH = os.path.join(GLib.get_user_config_dir(), "wselector", "config.json")
+CACHE_INDEX = os.path.join(CACHE_DIR, "cache_index.json")
+LOG_DIR = os.path.join(CACHE_DIR, "logs")
+WALLPAPERS_DIR = os.path.join(os.path.expanduser("~"), "Pictures", "WSelector")
+
+# Debug records are only produced when WSELECTOR_DEBUG is set
+LOG_LEVEL = logging.DEBUG if os.environ.get("WSELECTOR_DEBUG") else logging.INFO
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers.
+    
+    The stock prepare() formats the record, traceback included, on the
+    thread that logged it. Here only the message arguments are merged, so
+    later changes to them can't alter the record; exc_info is kept and the
+    listener's Formatter renders the traceback.
+    """
+    
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 # Setup logging
 def setup_logging():
-    """Configure logging with both file and console handlers"""
+    """Configure logging with file and console handlers fed through a queue.
+    
+    Log calls only enqueue the record; formatting, including tracebacks,
+    and I/O happen on the returned QueueListener's thread.
+    """
     # Create logs directory if it doesn't exist
-    log_dir = os.path.join(GLib.get_user_cache_dir(), "wselector", "logs")
-    os.makedirs(log_dir, exist_ok=True)
+    os.makedirs(LOG_DIR, exist_ok=True)
+    
+    # Handler errors (e.g. a stream closed during teardown) are reported
+    # nowhere instead of printing tracebacks; callers never guard log calls
+    logging.raiseExceptions = False
     
     # Create a custom logger
     logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(LOG_LEVEL)
     
     # Create handlers
-    log_file = os.path.join(log_dir, "wselector.log")
+    log_file = os.path.join(LOG_DIR, "wselector.log")
     file_handler = logging.FileHandler(log_file, mode='w')
     file_handler.setLevel(logging.DEBUG)
     
@@ -57,19 +98,18 @@ def setup_logging():
     if logger.hasHandlers():
         logger.handlers.clear()
     
-    # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue so callers never block on I/O
+    log_queue = queue.Queue(-1)
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
     
-    return logger
+    return logger, listener
 
 # Initialize logging
-logger = setup_logging()
-
-# Configuration paths
-CONFIG_PATH = os.path.join(GLib.get_user_config_dir(), "wselector", "config.json")
-CACHE_DIR = os.path.join(GLib.get_user_cache_dir(), "wselector")
-CACHE_INDEX = os.path.join(CACHE_DIR, "cache_index.json")
+logger, log_listener = setup_logging()
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -81,8 +121,72 @@ DEFAULT_CONFIG = {
     "theme": "light"  # Added theme with default light mode
 }
 
-# Ensure cache directory exists
-os.makedirs(CACHE_DIR, exist_ok=True)
+# Delay before pending configuration changes are written to disk
+CONFIG_FLUSH_DELAY_MS = 1000
+
+def _dump_config(config):
+    """Serialize the configuration to bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
+def _parse_config(data):
+    """Parse configuration bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _write_config(config):
+    """Write the configuration atomically with a single write() call."""
+    payload = _dump_config(config)
+    temp_path = f"{CONFIG_PATH}.tmp"
+    try:
+        with open(temp_path, 'wb', buffering=0) as f:
+            f.write(payload)
+            os.fsync(f.fileno())
+        os.replace(temp_path, CONFIG_PATH)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+# Memory sampling (driven by the GLib main loop)
+MEMORY_SAMPLE_INTERVAL = 5  # Seconds between RSS samples
+MEMORY_SAMPLE_HISTORY = 600  # Samples kept in the ring buffer
+MEMORY_LOG_EVERY = 10  # Samples batched into one log record
+MEMORY_SAMPLE_FORMAT = "\n  %.1fs: %.1fMB"  # One (timestamp, MB) sample in the batch
+
+# Minimum pending young-generation objects before a cleanup runs the GC.
+# Kept below gc's own threshold0 (700): the automatic collector already
+# runs gen 0 once the count passes that, so a higher bar would never fire.
+GC_MIN_PENDING = 350
+
+# Concurrent thumbnail downloads
+THUMBNAIL_WORKERS = 16
+
+# Rows above and below the viewport whose thumbnails stay loaded
+THUMBNAIL_KEEP_ROWS = 4
+
+# Bytes read per chunk when downloading a full-size wallpaper
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Seconds shutdown waits for tracked worker threads before exiting
+SHUTDOWN_JOIN_TIMEOUT = 2.0
+
+# Wallpaper widgets appended to the grid per idle callback
+FLOWBOX_BATCH_SIZE = 8
+
+# Detached wallpaper widgets kept for reuse after the grid is cleared
+WIDGET_POOL_SIZE = 256
+
+# Decoded thumbnail textures kept in memory, keyed by wallpaper ID
+THUMBNAIL_TEXTURE_CACHE_SIZE = 128
+
+# Ensure the config directory exists; setup_logging already created
+# CACHE_DIR along with LOG_DIR inside it
+os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
 
 class WSelectorApp(Adw.Application):
     def __init__(self, application_id, flags):
@@ -90,9 +194,13 @@ class WSelectorApp(Adw.Application):
         GLib.set_application_name("WSelector")
         GLib.set_prgname(application_id)
 
+        self._log_listener = log_listener
+
         # Initialize configuration
         self.config = DEFAULT_CONFIG.copy()
         self.load_config()  # This will update self.config with saved values
+        self._config_dirty = False
+        self._config_flush_id = 0
         
         # Initialize theme state
         self.is_dark_theme = self.config.get("theme", "light") == "dark"
@@ -109,11 +217,42 @@ class WSelectorApp(Adw.Application):
         
         # Search debounce timer
         self.search_timeout_id = None
-        self.search_delay_ms = 800  # 800ms delay - increased to accommodate fast typing
+        self.search_delay_ms = 300  # Only the last keystroke within this window triggers a search
+        self._dispatched_query = None  # Query of the last search sent to the API
+        self._load_generation = 0  # Bumped whenever the grid is reset; stale results are dropped
+
+        # Shared worker pools for network I/O, reused for the app's lifetime
+        self._thumb_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=THUMBNAIL_WORKERS,
+            thread_name_prefix="thumb"
+        )
+        self._search_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="search"
+        )
+        self._active_requests = set()  # In-flight futures, removed on completion
+        self._active_threads = set()  # Running worker threads, removed on exit
+        self._shutdown_event = threading.Event()  # Set once shutdown starts
+        self._thumbnail_futures = set()  # Thumbnail loads for the current grid
+        self._texture_cache = collections.OrderedDict()  # LRU of decoded thumbnails
+        self._placeholder_paintable = None  # Shared image-missing icon
+        self._wallpaper_widgets = []  # Wallpaper widgets in grid order, until _clear_flowbox releases them
+        self._widget_pool = []  # Detached wallpaper widgets ready for reuse
+        self._row_height = 0  # Height of one grid row incl. spacing, measured once
+        self._widget_cleanup_id = 0
+
+        # Memory sampling state
+        self._memory_source_id = 0
+        self._memory_samples = collections.deque(maxlen=MEMORY_SAMPLE_HISTORY)
+        self._memory_peak = 0.0
+        self._memory_sample_count = 0
 
         self.connect("notify::default-width", self.on_window_size_changed)
         self.connect("notify::default-height", self.on_window_size_changed)
 
+        # Shared API client; its session keeps connections alive between searches
+        self.scraper = WSelectorScraper()
+
         self.create_action("preferences", self.on_preferences)
         self.create_action("view_downloads", self.on_view_downloads)
         self.create_action("about", self.on_about)
@@ -280,9 +419,6 @@ class WSelectorApp(Adw.Application):
         self.win.set_title("WSelector")
         self.win.set_default_size(800, 650)
         
-        # Initialize scraper
-        self.scraper = WSelectorScraper()
-        
         # Create toast overlay
         self.toast_overlay = Adw.ToastOverlay()
         
@@ -375,14 +511,13 @@ class WSelectorApp(Adw.Application):
         # Show the window
         self.win.present()
         
+        # Start periodic memory sampling
+        self._setup_memory_monitoring()
+        
         # Load initial wallpapers
         self.load_wallpapers()
         self.win.set_child(self.main_box)
         
-        # Initialize scraper if not already done
-        if not hasattr(self, 'scraper'):
-            self.scraper = WSelectorScraper()
-            
         # Only load preferences if not already loaded
         if not hasattr(self, '_preferences_loaded') or not self._preferences_loaded:
             self.load_preferences()
@@ -394,6 +529,13 @@ class WSelectorApp(Adw.Application):
             self.load_wallpapers()
 
         self.win.present()
+        
+        # Move the long-lived objects created during startup out of GC scans,
+        # collecting first so startup garbage isn't frozen along with them
+        if not getattr(self, '_gc_frozen', False):
+            gc.collect()
+            gc.freeze()
+            self._gc_frozen = True
 
     def clear_wallpaper_cache(self):
         """Clear the in-memory wallpaper cache."""
@@ -402,16 +544,7 @@ class WSelectorApp(Adw.Application):
             self._wallpapers = []
             
         if hasattr(self, 'flowbox') and self.flowbox is not None:
-            # Get a list of all children first to avoid modification during iteration
-            children = []
-            child = self.flowbox.get_first_child()
-            while child is not None:
-                children.append(child)
-                child = child.get_next_sibling()
-                
-            # Remove all children
-            for child in children:
-                self.flowbox.remove(child)
+            self._clear_flowbox()
                 
         # Clear any thumbnail caches
         if hasattr(self, '_thumbnail_cache'):
@@ -465,23 +598,17 @@ class WSelectorApp(Adw.Application):
         GLib.timeout_add(100, set_scroll)
 
     def _clear_thumbnail_cache(self):
-        """Clear the thumbnail cache and reset related state."""
-        logger.info("Clearing thumbnail cache")
+        """Clear the thumbnail cache and cancel queued thumbnail loads."""
+        logger.debug("Clearing thumbnail cache")
         if hasattr(self, '_thumbnail_widgets'):
             # Clear the thumbnail widgets dictionary
             self._thumbnail_widgets.clear()
         
-        # Clear any pending thumbnail loads
-        if hasattr(self, '_thumbnail_executor') and self._thumbnail_executor:
-            self._thumbnail_executor.shutdown(wait=False)
-            self._thumbnail_executor = None
-        
-        # Clear any pending futures
-        if hasattr(self, '_thumbnail_futures'):
-            for future in self._thumbnail_futures:
-                if not future.done():
-                    future.cancel()
-            self._thumbnail_futures.clear()
+        # Cancel loads that have not started yet; their widgets are going away.
+        # Cancelling runs the discard callback, so iterate over a copy.
+        for future in list(self._thumbnail_futures):
+            future.cancel()
+        self._thumbnail_futures.clear()
     
     def perform_search(self):
         """Perform the actual search after the debounce delay"""
@@ -490,12 +617,17 @@ class WSelectorApp(Adw.Application):
         # Reset the timeout ID
         self.search_timeout_id = None
         
-        # Clear existing thumbnails and cache
-        self._clear_thumbnail_cache()
+        # Skip the request if the text settled back on the query already shown
+        if (self.current_query or "") == self._dispatched_query:
+            logger.debug("Search query unchanged, skipping reload")
+            if hasattr(self, 'spinner') and self.spinner is not None:
+                self.spinner.stop()
+                self.spinner.hide()
+            return False
         
         # Reset to page 1 and clear the flowbox
         self.current_page = 1
-        self.flowbox.remove_all()
+        self._clear_flowbox()
         
         # Reset scroll position to top
         self._reset_scroll_position()
@@ -504,10 +636,10 @@ class WSelectorApp(Adw.Application):
         # If query is empty, explicitly pass None to trigger reload with saved preferences
         if not self.current_query:
             logger.info("Search text cleared, reloading with saved preferences")
-            self.load_wallpapers(query=None)
+            self.load_wallpapers(query=None, force_reload=True)
         else:
             logger.info(f"Search changed - Loading wallpapers with query: '{self.current_query}'")
-            self.load_wallpapers(query=self.current_query)
+            self.load_wallpapers(query=self.current_query, force_reload=True)
             
         # Return False to prevent the timeout from repeating
         return False
@@ -525,7 +657,7 @@ class WSelectorApp(Adw.Application):
             
         # Reset to page 1 and clear the flowbox
         self.current_page = 1
-        self.flowbox.remove_all()
+        self._clear_flowbox()
         
         # Reset scroll position to top
         if hasattr(self, 'scroll'):
@@ -538,16 +670,11 @@ class WSelectorApp(Adw.Application):
         selected_item = dropdown.get_selected_item()
         if selected_item:
             sort_mode = selected_item.get_string().lower()
-            self.config["sort_mode"] = sort_mode
-            self.save_preferences()
+            self._set_config("sort_mode", sort_mode)
             # Force a full reload with the new sort mode
             self.current_page = 1
             # Clear existing wallpapers
-            child = self.flowbox.get_first_child()
-            while child is not None:
-                next_child = child.get_next_sibling()
-                self.flowbox.remove(child)
-                child = next_child
+            self._clear_flowbox()
             # Reset scroll position to top
             if hasattr(self, 'scroll'):
                 self.scroll.get_vadjustment().set_value(0)
@@ -583,29 +710,40 @@ class WSelectorApp(Adw.Application):
             style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
             button.set_icon_name("weather-clear-night-symbolic")
             # Save preference to config
-            self.config["theme"] = "dark"
+            self._set_config("theme", "dark")
         else:
             # Set light theme
             style_manager.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
             button.set_icon_name("weather-clear-symbolic")
             # Save preference to config
-            self.config["theme"] = "light"
+            self._set_config("theme", "light")
             
-        # Save config to file
-        self.save_config()
-        logger.info(f"Theme preference saved: {self.config['theme']}")
+        logger.info(f"Theme preference updated: {self.config['theme']}")
         
         # Show a toast notification to confirm theme change
         toast = Adw.Toast.new(f"Theme changed to {self.config['theme']}")
         toast.set_timeout(2)
         self.toast_overlay.add_toast(toast)
         
+    def _set_config(self, key, value):
+        """Update a configuration value and schedule a coalesced write."""
+        self.config[key] = value
+        self._config_dirty = True
+        if not self._config_flush_id:
+            self._config_flush_id = GLib.timeout_add(CONFIG_FLUSH_DELAY_MS, self._flush_config)
+
+    def _flush_config(self):
+        """Write pending configuration changes to disk."""
+        self._config_flush_id = 0
+        if self._config_dirty:
+            self.save_config()
+        return GLib.SOURCE_REMOVE
+
     def save_config(self):
         """Save current configuration to the config file."""
         try:
-            os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-            with open(CONFIG_PATH, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            _write_config(self.config)
+            self._config_dirty = False
             logger.info(f"Configuration saved to {CONFIG_PATH}")
             return True
         except Exception as e:
@@ -615,11 +753,10 @@ class WSelectorApp(Adw.Application):
             
     def load_preferences(self):
         try:
-            if os.path.exists(CONFIG_PATH):
-                with open(CONFIG_PATH, 'r') as f:
-                    self.config = json.load(f)
-            else:
-                self.config = DEFAULT_CONFIG.copy()
+            with open(CONFIG_PATH, 'rb') as f:
+                self.config = _parse_config(f.read())
+        except FileNotFoundError:
+            self.config = DEFAULT_CONFIG.copy()
         except Exception as e:
             logger.error(f"Error loading preferences: {e}")
             self.config = DEFAULT_CONFIG.copy()
@@ -633,35 +770,36 @@ class WSelectorApp(Adw.Application):
                 
             self.config = DEFAULT_CONFIG.copy()
             
-            if os.path.exists(CONFIG_PATH):
-                try:
-                    with open(CONFIG_PATH, 'r') as f:
-                        loaded_config = json.load(f)
-                        
-                    # Validate and update configuration
-                    if isinstance(loaded_config, dict):
-                        # Ensure required keys exist with proper types
-                        if "selected_categories" in loaded_config and isinstance(loaded_config["selected_categories"], list):
-                            self.config["selected_categories"] = loaded_config["selected_categories"]
-                        if "selected_purity" in loaded_config and isinstance(loaded_config["selected_purity"], list):
-                            self.config["selected_purity"] = loaded_config["selected_purity"]
-                        if "sort_mode" in loaded_config and isinstance(loaded_config["sort_mode"], str):
-                            self.config["sort_mode"] = loaded_config["sort_mode"]
-                        if "categories" in loaded_config and isinstance(loaded_config["categories"], str):
-                            self.config["categories"] = loaded_config["categories"]
-                        if "purity" in loaded_config and isinstance(loaded_config["purity"], str):
-                            self.config["purity"] = loaded_config["purity"]
-                        if "resolution" in loaded_config and loaded_config["resolution"]:
-                            self.config["resolution"] = loaded_config["resolution"]
-                        if "theme" in loaded_config and isinstance(loaded_config["theme"], str):
-                            self.config["theme"] = loaded_config["theme"]
-                            # Update the theme state to match the loaded config
-                            self.is_dark_theme = self.config["theme"] == "dark"
-                except json.JSONDecodeError:
-                    logger.warning("Invalid config file, using defaults")
-                except Exception as e:
-                    logger.error(f"Error loading config: {e}")
-            
+            try:
+                with open(CONFIG_PATH, 'rb') as f:
+                    loaded_config = _parse_config(f.read())
+                    
+                # Validate and update configuration
+                if isinstance(loaded_config, dict):
+                    # Ensure required keys exist with proper types
+                    if "selected_categories" in loaded_config and isinstance(loaded_config["selected_categories"], list):
+                        self.config["selected_categories"] = loaded_config["selected_categories"]
+                    if "selected_purity" in loaded_config and isinstance(loaded_config["selected_purity"], list):
+                        self.config["selected_purity"] = loaded_config["selected_purity"]
+                    if "sort_mode" in loaded_config and isinstance(loaded_config["sort_mode"], str):
+                        self.config["sort_mode"] = loaded_config["sort_mode"]
+                    if "categories" in loaded_config and isinstance(loaded_config["categories"], str):
+                        self.config["categories"] = loaded_config["categories"]
+                    if "purity" in loaded_config and isinstance(loaded_config["purity"], str):
+                        self.config["purity"] = loaded_config["purity"]
+                    if "resolution" in loaded_config and loaded_config["resolution"]:
+                        self.config["resolution"] = loaded_config["resolution"]
+                    if "theme" in loaded_config and isinstance(loaded_config["theme"], str):
+                        self.config["theme"] = loaded_config["theme"]
+                        # Update the theme state to match the loaded config
+                        self.is_dark_theme = self.config["theme"] == "dark"
+            except FileNotFoundError:
+                pass  # First run, keep the defaults
+            except json.JSONDecodeError:
+                logger.warning("Invalid config file, using defaults")
+            except Exception as e:
+                logger.error(f"Error loading config: {e}")
+        
             # Ensure we have at least one category and purity selected
             if not self.config["selected_categories"]:
                 self.config["selected_categories"] = ["General"]
@@ -679,10 +817,6 @@ class WSelectorApp(Adw.Application):
     def save_preferences(self):
         """Save current preferences to the config file."""
         try:
-            # Ensure config directory exists
-            config_dir = os.path.dirname(CONFIG_PATH)
-            os.makedirs(config_dir, exist_ok=True)
-            
             # Ensure we have default values if they're missing
             self.config.setdefault("selected_categories", ["General"])
             self.config.setdefault("selected_purity", ["SFW"])
@@ -690,26 +824,13 @@ class WSelectorApp(Adw.Application):
             self.config.setdefault("purity", "100")
             self.config.setdefault("sort_mode", "latest")
             
-            # Write to a temporary file first, then atomically rename
-            temp_path = f"{CONFIG_PATH}.tmp"
-            with open(temp_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
-                f.flush()
-                os.fsync(f.fileno())
-            
-            # Atomic rename to ensure we don't corrupt the file
-            os.replace(temp_path, CONFIG_PATH)
+            _write_config(self.config)
+            self._config_dirty = False
             logger.info(f"Successfully saved preferences to {CONFIG_PATH}")
             return True
             
         except Exception as e:
             logger.error(f"Error saving preferences: {e}", exc_info=True)
-            # Try to clean up temp file if it exists
-            if 'temp_path' in locals() and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
             return False
     
             self.config.setdefault("selected_categories", ["General"])
@@ -791,7 +912,7 @@ class WSelectorApp(Adw.Application):
                 old_purity != new_purity):
                 logger.info(f"Preferences changed, reloading wallpapers")
                 self.current_page = 1
-                self.flowbox.remove_all()
+                self._clear_flowbox()
                 
                 # Debug logging for search query state
                 logger.info(f"apply_preferences - Before reload - Current search query: '{self.current_query}'")
@@ -816,8 +937,6 @@ class WSelectorApp(Adw.Application):
             prefetch: If True, load in background without showing spinner
             force_reload: If True, force a reload even if already loading
         """
-        check_memory_usage()
-        
         # Skip if already loading the same page and not forcing a reload
         if (self.loading and not force_reload and 
             hasattr(self, 'current_query') and self.current_query == query and 
@@ -849,12 +968,16 @@ class WSelectorApp(Adw.Application):
         if (page == 1 or force_reload) and not prefetch:
             logger.info("Loading first page, clearing existing wallpapers")
             # Clear the flowbox - GTK4 compatible way
-            child = self.flowbox.get_first_child()
-            while child is not None:
-                next_child = child.get_next_sibling()
-                self.flowbox.remove(child)
-                child = next_child
+            self._clear_flowbox()
             self.flowbox.show()
+            
+            # Invalidate results of any search still in flight
+            self._load_generation += 1
+            self._dispatched_query = self.current_query
+            if hasattr(self, 'prefetched_wallpapers'):
+                self.prefetched_wallpapers.clear()
+        
+        generation = self._load_generation
         
         # Set loading state first
         self.loading = True
@@ -953,6 +1076,11 @@ class WSelectorApp(Adw.Application):
                         logger.info("Reached end of search results")
                         GLib.idle_add(self.show_info_toast, "No more wallpapers found")
                 
+                # Drop results superseded by a newer search
+                if generation != self._load_generation:
+                    logger.debug(f"Discarding stale results for query: {query}")
+                    return
+                
                 # Handle the wallpapers based on whether this is a prefetch or not
                 if prefetch:
                     # Store prefetched wallpapers with their has_next_page status
@@ -966,7 +1094,7 @@ class WSelectorApp(Adw.Application):
                     if page > self.current_page:
                         self.current_page = page
                     # Update the UI with the new wallpapers
-                    GLib.idle_add(self.populate_flowbox, wallpapers)
+                    GLib.idle_add(self.populate_flowbox, wallpapers, generation)
             
             except Exception as error:
                 logger.error(f"Error loading wallpapers: {error}", exc_info=True)
@@ -990,14 +1118,12 @@ class WSelectorApp(Adw.Application):
                         except Exception as e:
                             logger.error(f"Error hiding spinner: {e}")
                     GLib.idle_add(hide_spinner)
-                # Always reset loading state
-                self.loading = False
-        
-        # Start the fetch operation in a background thread
-        thread = threading.Thread(target=fetch, daemon=True)
-        thread.start()
+                # Reset loading state unless a newer search now owns it
+                if generation == self._load_generation:
+                    self.loading = False
         
-        check_memory_usage()
+        # Run the fetch operation on the search worker pool
+        self._submit_request(self._search_executor, fetch)
     
     def _restore_scroll_position(self):
         """Restore the scroll position after loading new items."""
@@ -1057,12 +1183,17 @@ class WSelectorApp(Adw.Application):
                 if hasattr(child, 'load_async') and not hasattr(child, '_loaded'):
                     child.load_async()
     
-    def populate_flowbox(self, wallpapers):
+    def populate_flowbox(self, wallpapers, generation=None):
         """Populate the flowbox with wallpapers using lazy loading."""
+        if generation is not None and generation != self._load_generation:
+            logger.debug("Skipping populate_flowbox for a superseded search")
+            return False
+        
         try:
-            logger.debug(f"=== populate_flowbox called with {len(wallpapers)} wallpapers ===")
-            logger.debug(f"Current page: {self.current_page}")
-            logger.debug(f"Flowbox exists: {hasattr(self, 'flowbox')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"=== populate_flowbox called with {len(wallpapers)} wallpapers ===")
+                logger.debug(f"Current page: {self.current_page}")
+                logger.debug(f"Flowbox exists: {hasattr(self, 'flowbox')}")
             
             # Initialize flowbox if it doesn't exist
             if not hasattr(self, 'flowbox') or self.flowbox is None:
@@ -1094,11 +1225,7 @@ class WSelectorApp(Adw.Application):
             # Clear existing wallpapers if this is the first page
             if self.current_page == 1:
                 logger.debug("Clearing existing wallpapers (first page)")
-                child = self.flowbox.get_first_child()
-                while child is not None:
-                    next_child = child.get_next_sibling()
-                    self.flowbox.remove(child)
-                    child = next_child
+                self._clear_flowbox()
             else:
                 logger.debug(f"Appending to existing wallpapers (page {self.current_page})")
                 
@@ -1142,87 +1269,28 @@ class WSelectorApp(Adw.Application):
             should_restore = hasattr(self, 'scroll_position')
             
             logger.info(f"Adding {len(wallpapers)} wallpapers to flowbox (page {self.current_page})")
-            logger.debug(f"Scroll position - Value: {adj.get_value():.1f}, Upper: {adj.get_upper():.1f}, Page Size: {adj.get_page_size():.1f}")
-            logger.debug(f"Was at bottom: {was_at_bottom}, Should restore: {should_restore}")
-            
-            # Add wallpapers to flowbox
-            for wp in wallpapers:
-                try:
-                    # Create main container
-                    box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-                    box.set_margin_top(6)
-                    box.set_margin_bottom(6)
-                    box.set_margin_start(6)
-                    box.set_margin_end(6)
-                    
-                    # Create frame for the image
-                    frame = Gtk.Frame()
-                    frame.set_hexpand(True)
-                    frame.set_vexpand(True)
-                    frame.set_size_request(200, 200)
-                    
-                    # Create overlay for the image
-                    overlay = Gtk.Overlay()
-                    
-                    # Create image
-                    image = Gtk.Picture()
-                    image.set_size_request(200, 200)
-                    image.set_can_shrink(True)
-                    
-                    # Create a new spinner for this wallpaper
-                    spinner = Gtk.Spinner()
-                    spinner.set_halign(Gtk.Align.CENTER)
-                    spinner.set_valign(Gtk.Align.CENTER)
-                    spinner.start()
-                    
-                    # Add spinner to overlay
-                    overlay.add_overlay(spinner)
-                    overlay.set_child(image)
-                    
-                    # Try to load cached image first
-                    if wp.is_cached():
-                        try:
-                            file = Gio.File.new_for_path(wp.get_cached_path())
-                            image.set_file(file)
-                            spinner.hide()
-                        except Exception as e:
-                            logger.error(f"Error loading cached image: {e}")
-                            # Show error icon
-                            icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
-                            icon_paintable = icon_theme.lookup_icon("image-missing-symbolic", [], 48, 1, Gtk.TextDirection.NONE, 0)
-                            if icon_paintable:
-                                image.set_paintable(icon_paintable)
-                            spinner.hide()
-                    else:
-                        # Start async download
-                        self.download_thumbnail_async(wp, image, spinner)
-                    
-                    # Add click handler
-                    gesture = Gtk.GestureClick.new()
-                    gesture.connect("pressed", self.on_wallpaper_clicked, wp)
-                    box.add_controller(gesture)
-                    
-                    # Add to flowbox
-                    frame.set_child(overlay)
-                    box.append(frame)
-                    self.flowbox.append(box)
-                    
-                except Exception as e:
-                    logger.error(f"Error creating wallpaper widget: {e}", exc_info=True)
-            
-            # Force a relayout
-            self.flowbox.queue_allocate()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Scroll position - Value: {adj.get_value():.1f}, Upper: {adj.get_upper():.1f}, Page Size: {adj.get_page_size():.1f}")
+                logger.debug(f"Was at bottom: {was_at_bottom}, Should restore: {should_restore}")
             
-            # Restore scroll position if needed
+            # Restore scroll position once every batch is in, so the content
+            # height is final and the saved value isn't clamped
+            on_complete = None
             if should_restore:
-                def delayed_restore():
+                def on_complete():
                     try:
                         self._restore_scroll_position()
                         if hasattr(self, 'scroll_position'):
                             delattr(self, 'scroll_position')
                     except Exception as e:
                         logger.error(f"Error in delayed_restore: {e}")
-                GLib.timeout_add(300, delayed_restore)
+            
+            # Insert in small batches at low priority so input and drawing
+            # are not held up behind a whole page of widget construction
+            GLib.idle_add(
+                self._append_wallpaper_batch, iter(wallpapers), self._load_generation,
+                on_complete, priority=GLib.PRIORITY_LOW
+            )
             
         except Exception as e:
             logger.error(f"Error in populate_flowbox: {e}", exc_info=True)
@@ -1230,50 +1298,271 @@ class WSelectorApp(Adw.Application):
             toast.set_timeout(3)
             self.toast_overlay.add_toast(toast)
 
+    def _append_wallpaper_batch(self, wallpapers, generation, on_complete=None):
+        """Append up to FLOWBOX_BATCH_SIZE wallpapers; repeats until exhausted.
+        
+        on_complete, if given, is called after the last batch is appended.
+        """
+        if generation != self._load_generation:
+            return GLib.SOURCE_REMOVE
+        
+        batch = list(itertools.islice(wallpapers, FLOWBOX_BATCH_SIZE))
+        for wp in batch:
+            try:
+                box = self._acquire_wallpaper_widget()
+                image = box.picture
+                spinner = box.spinner
+                image.wallpaper_id = wp.id
+                
+                # Reuse an already decoded texture if we have one
+                texture = self._get_cached_texture(wp.id)
+                if texture is not None:
+                    image.set_paintable(texture)
+                    spinner.hide()
+                else:
+                    # Load from disk cache or download, decoding off the UI thread
+                    self.download_thumbnail_async(wp, image, spinner)
+                
+                # Add to flowbox
+                box.wallpaper = wp
+                box.thumbnail_released = False
+                self.flowbox.append(box)
+                self._wallpaper_widgets.append(box)
+                
+            except Exception as e:
+                logger.error(f"Error creating wallpaper widget: {e}", exc_info=True)
+        
+        if len(batch) < FLOWBOX_BATCH_SIZE:
+            if on_complete is not None:
+                on_complete()
+            return GLib.SOURCE_REMOVE
+        return GLib.SOURCE_CONTINUE
+
+    def _acquire_wallpaper_widget(self):
+        """Return a wallpaper widget from the pool, or build a new one."""
+        try:
+            return self._widget_pool.pop()
+        except IndexError:
+            pass
+        
+        # Create main container
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        box.set_margin_top(6)
+        box.set_margin_bottom(6)
+        box.set_margin_start(6)
+        box.set_margin_end(6)
+        
+        # Create frame for the image
+        frame = Gtk.Frame()
+        frame.set_hexpand(True)
+        frame.set_vexpand(True)
+        frame.set_size_request(200, 200)
+        
+        # Create overlay for the image
+        overlay = Gtk.Overlay()
+        
+        # Create image
+        image = Gtk.Picture()
+        image.set_size_request(200, 200)
+        image.set_can_shrink(True)
+        
+        # Create a spinner shown until the thumbnail arrives
+        spinner = Gtk.Spinner()
+        spinner.set_halign(Gtk.Align.CENTER)
+        spinner.set_valign(Gtk.Align.CENTER)
+        spinner.start()
+        
+        # Add spinner to overlay
+        overlay.add_overlay(spinner)
+        overlay.set_child(image)
+        
+        # Add click handler; the wallpaper is looked up when clicked so the
+        # widget can be recycled for another wallpaper
+        gesture = Gtk.GestureClick.new()
+        gesture.connect("pressed", self._on_wallpaper_widget_pressed)
+        box.add_controller(gesture)
+        
+        frame.set_child(overlay)
+        box.append(frame)
+        box.picture = image
+        box.spinner = spinner
+        return box
+
+    def _release_wallpaper_widgets(self, boxes):
+        """Reset detached wallpaper widgets and return them to the pool."""
+        for box in boxes:
+            if len(self._widget_pool) >= WIDGET_POOL_SIZE:
+                break
+            box.picture.set_paintable(None)
+            box.picture.wallpaper_id = None
+            box.spinner.start()
+            box.spinner.show()
+            box.wallpaper = None
+            self._widget_pool.append(box)
+
+    def _on_wallpaper_widget_pressed(self, gesture, n_press, x, y):
+        """Forward a click on a wallpaper widget to on_wallpaper_clicked."""
+        wallpaper = getattr(gesture.get_widget(), 'wallpaper', None)
+        if wallpaper is not None:
+            self.on_wallpaper_clicked(gesture, n_press, x, y, wallpaper)
+
     def download_thumbnail_async(self, wp, image, spinner):
-        def download_complete(path, error=None):
+        def download_complete(texture, error=None):
+            # The widget may have been recycled for another wallpaper meanwhile
+            if getattr(image, 'wallpaper_id', wp.id) != wp.id:
+                if texture is not None:
+                    self._cache_texture(wp.id, texture)
+                return
+            
             if error:
                 logger.error(f"Failed to download thumbnail: {error}")
-                # Create a placeholder image instead of using set_icon_name
-                try:
-                    # Try to load a system icon as a fallback
-                    icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
-                    icon_paintable = icon_theme.lookup_icon("image-missing-symbolic", [], 48, 1, Gtk.TextDirection.NONE, 0)
-                    if icon_paintable:
-                        image.set_paintable(icon_paintable)
-                except Exception as icon_error:
-                    logger.error(f"Failed to set placeholder icon: {icon_error}")
+                # Show the shared placeholder icon
+                placeholder = self._get_placeholder_paintable()
+                if placeholder:
+                    image.set_paintable(placeholder)
                 spinner.hide()
                 return
                 
             try:
-                file = Gio.File.new_for_path(path)
-                image.set_file(file)
+                self._cache_texture(wp.id, texture)
+                image.set_paintable(texture)
                 spinner.hide()
             except Exception as e:
                 logger.error(f"Error loading downloaded image {wp.id}: {e}")
-                # Create a placeholder image instead of using set_icon_name
-                try:
-                    # Try to load a system icon as a fallback
-                    icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
-                    icon_paintable = icon_theme.lookup_icon("image-missing-symbolic", [], 48, 1, Gtk.TextDirection.NONE, 0)
-                    if icon_paintable:
-                        image.set_paintable(icon_paintable)
-                except Exception as icon_error:
-                    logger.error(f"Failed to set placeholder icon: {icon_error}")
+                # Show the shared placeholder icon
+                placeholder = self._get_placeholder_paintable()
+                if placeholder:
+                    image.set_paintable(placeholder)
                 spinner.hide()
         
         def download_thread():
             try:
                 path = download_thumbnail(wp)
-                GLib.idle_add(download_complete, path)
+                if not path:
+                    raise RuntimeError(f"No thumbnail available for {wp.id}")
+                # Texture constructors are thread-safe, so decode here
+                texture = Gdk.Texture.new_from_filename(path)
+                GLib.idle_add(download_complete, texture)
             except Exception as e:
                 GLib.idle_add(download_complete, None, str(e))
         
-        threading.Thread(target=download_thread, daemon=True).start()
+        future = self._submit_request(self._thumb_executor, download_thread)
+        self._thumbnail_futures.add(future)
+        future.add_done_callback(self._thumbnail_futures.discard)
+
+    def _clear_flowbox(self):
+        """Remove every wallpaper widget from the main grid."""
+        self._clear_thumbnail_cache()
+        boxes = self._wallpaper_widgets
+        self.flowbox.remove_all()
+        self._wallpaper_widgets = []
+        self._release_wallpaper_widgets(boxes)
+
+    def _cleanup_wallpaper_widgets(self):
+        """Release thumbnails far outside the viewport.
+        
+        The grid is homogeneous, so the visible range is computed from the
+        scroll offset and a row height measured once, without querying the
+        allocation of every child.
+        """
+        boxes = self._wallpaper_widgets
+        if not boxes or not hasattr(self, 'scroll'):
+            return
+        
+        # The FlowBoxChild wrapping the first widget gives the cell size
+        cell = boxes[0].get_parent()
+        if cell is None:
+            return
+        cell_width = cell.get_width()
+        if not self._row_height:
+            self._row_height = cell.get_height() + self.flowbox.get_row_spacing()
+        if self._row_height <= 0 or cell_width <= 0:
+            self._row_height = 0
+            return  # Not allocated yet
+        
+        spacing = self.flowbox.get_column_spacing()
+        cols = max(1, (self.flowbox.get_width() + spacing) // (cell_width + spacing))
+        
+        adj = self.scroll.get_vadjustment()
+        top = adj.get_value()
+        bottom = top + adj.get_page_size()
+        margin = THUMBNAIL_KEEP_ROWS * cols
+        first = max(0, int(top // self._row_height) * cols - margin)
+        last = (int(bottom // self._row_height) + 1) * cols + margin
+        
+        # Release offscreen thumbnails; their layout size is fixed by the frame
+        for box in boxes[:first] + boxes[last:]:
+            if box.picture.get_paintable() is not None:
+                box.picture.set_paintable(None)
+                box.thumbnail_released = True
+        
+        # Reload thumbnails that scrolled back into range
+        for box in boxes[first:last]:
+            if box.thumbnail_released:
+                box.thumbnail_released = False
+                texture = self._get_cached_texture(box.wallpaper.id)
+                if texture is not None:
+                    box.picture.set_paintable(texture)
+                else:
+                    box.spinner.show()
+                    self.download_thumbnail_async(box.wallpaper, box.picture, box.spinner)
+
+    def _schedule_widget_cleanup(self):
+        """Run _cleanup_wallpaper_widgets shortly, coalescing bursts of scroll events."""
+        if self._widget_cleanup_id:
+            return
+        
+        def run_cleanup():
+            self._widget_cleanup_id = 0
+            self._cleanup_wallpaper_widgets()
+            return GLib.SOURCE_REMOVE
+        
+        self._widget_cleanup_id = GLib.timeout_add(200, run_cleanup)
+
+    def _get_placeholder_paintable(self):
+        """Return the image-missing icon, looked up from the theme only once."""
+        if self._placeholder_paintable is None:
+            try:
+                icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+                self._placeholder_paintable = icon_theme.lookup_icon(
+                    "image-missing-symbolic", [], 48, 1, Gtk.TextDirection.NONE, 0
+                )
+            except Exception as e:
+                logger.error(f"Failed to look up placeholder icon: {e}")
+        return self._placeholder_paintable
+
+    def _get_cached_texture(self, key):
+        """Return a decoded thumbnail from the LRU cache, or None."""
+        texture = self._texture_cache.get(key)
+        if texture is not None:
+            self._texture_cache.move_to_end(key)
+        return texture
+
+    def _cache_texture(self, key, texture):
+        """Store a decoded thumbnail, evicting the least recently used one."""
+        self._texture_cache[key] = texture
+        self._texture_cache.move_to_end(key)
+        while len(self._texture_cache) > THUMBNAIL_TEXTURE_CACHE_SIZE:
+            self._texture_cache.popitem(last=False)
+
+    def _submit_request(self, executor, fn, *args):
+        """Submit a background request and track it until it completes."""
+        future = executor.submit(fn, *args)
+        self._active_requests.add(future)
+        future.add_done_callback(self._active_requests.discard)
+        return future
+
+    def _run_tracked(self, fn, *args):
+        """Run fn in the current worker thread, tracking it while it runs."""
+        thread = threading.current_thread()
+        self._active_threads.add(thread)
+        try:
+            fn(*args)
+        finally:
+            self._active_threads.discard(thread)
 
     def on_scroll_changed(self, adj):
-        check_memory_usage()
+        self._schedule_widget_cleanup()
         
         try:
             # Get scroll values
@@ -1326,11 +1615,12 @@ class WSelectorApp(Adw.Application):
                 self.prefetched_wallpapers = {}
             
             # Detailed debug logging
-            logger.debug("\n--- Scroll Event ---")
-            logger.debug(f"Value: {value:.1f}, Upper: {upper:.1f}, Page Size: {page_size:.1f}")
-            logger.debug(f"Scroll Position: {scroll_position:.2f} ({(scroll_position*100):.0f}%)")
-            logger.debug(f"Current Page: {self.current_page}, Next Page: {next_page}")
-            logger.debug(f"Loading: {self.loading}, Prefetched Pages: {list(self.prefetched_wallpapers.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n--- Scroll Event ---")
+                logger.debug(f"Value: {value:.1f}, Upper: {upper:.1f}, Page Size: {page_size:.1f}")
+                logger.debug(f"Scroll Position: {scroll_position:.2f} ({(scroll_position*100):.0f}%)")
+                logger.debug(f"Current Page: {self.current_page}, Next Page: {next_page}")
+                logger.debug(f"Loading: {self.loading}, Prefetched Pages: {list(self.prefetched_wallpapers.keys())}")
             
             if self.loading:
                 logger.debug("Skipping scroll check - already loading")
@@ -1353,11 +1643,12 @@ class WSelectorApp(Adw.Application):
                     self.prefetched_wallpapers = {}
                 
                 # Detailed debug logging
-                logger.debug("\n--- Scroll Event ---")
-                logger.debug(f"Value: {value:.1f}, Upper: {upper:.1f}, Page Size: {page_size:.1f}")
-                logger.debug(f"Scroll Position: {scroll_ratio:.2f} ({scroll_ratio*100:.0f}%)")
-                logger.debug(f"Current Page: {self.current_page}, Next Page: {next_page}")
-                logger.debug(f"Loading: {self.loading}, Prefetched Pages: {list(self.prefetched_wallpapers.keys())}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("\n--- Scroll Event ---")
+                    logger.debug(f"Value: {value:.1f}, Upper: {upper:.1f}, Page Size: {page_size:.1f}")
+                    logger.debug(f"Scroll Position: {scroll_ratio:.2f} ({scroll_ratio*100:.0f}%)")
+                    logger.debug(f"Current Page: {self.current_page}, Next Page: {next_page}")
+                    logger.debug(f"Loading: {self.loading}, Prefetched Pages: {list(self.prefetched_wallpapers.keys())}")
                 
                 if self.loading:
                     logger.debug("Skipping scroll check - already loading")
@@ -1366,7 +1657,8 @@ class WSelectorApp(Adw.Application):
                 # Check if we're near the bottom (within 30% of the page size from the bottom)
                 scroll_threshold = page_size * 0.3  # 30% of the page size
                 if value + page_size < upper - scroll_threshold:
-                    logger.debug(f"Not at threshold yet: {value + page_size:.1f} < {upper - scroll_threshold:.1f}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Not at threshold yet: {value + page_size:.1f} < {upper - scroll_threshold:.1f}")
                     return
                 
                 if next_page in self.prefetched_wallpapers:
@@ -1449,11 +1741,7 @@ class WSelectorApp(Adw.Application):
                 self.current_page = 1
                 
                 # Clear the flowbox
-                child = self.flowbox.get_first_child()
-                while child is not None:
-                    next_child = child.get_next_sibling()
-                    self.flowbox.remove(child)
-                    child = next_child
+                self._clear_flowbox()
                 
                 # Reset scroll position to top 
                 if hasattr(self, 'scroll'):
@@ -1635,10 +1923,7 @@ class WSelectorApp(Adw.Application):
         
     def get_wallpapers_dir(self):
         """Get the wallpapers directory in user's Pictures folder"""
-        # Get user's home directory
-        home_dir = os.path.expanduser("~")
-        # Create path to Pictures/WSelector folder
-        return os.path.join(home_dir, "Pictures", "WSelector")
+        return WALLPAPERS_DIR
         
     def get_screen_resolution(self):
         """Get the user's screen resolution"""
@@ -1715,15 +2000,18 @@ class WSelectorApp(Adw.Application):
             # Show a toast notification that download is starting
             self.show_info_toast(f"Starting download: {wallpaper.id}")
             # Start the download in a separate thread to keep the UI responsive
-            threading.Thread(target=self.download_wallpaper, args=(wallpaper,), daemon=True).start()
+            threading.Thread(
+                target=self._run_tracked,
+                args=(self.download_wallpaper, wallpaper),
+                daemon=True
+            ).start()
         dialog.destroy()
     
     def download_wallpaper(self, wallpaper):
         try:
             # Create downloads directory if it doesn't exist
             download_dir = self.get_wallpapers_dir()
-            if not os.path.exists(download_dir):
-                os.makedirs(download_dir)
+            os.makedirs(download_dir, exist_ok=True)
                 
             # Get the filename from the ID
             filename = f"{wallpaper.id}.jpg"
@@ -1738,8 +2026,24 @@ class WSelectorApp(Adw.Application):
                 'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             req = urllib.request.Request(wallpaper.url, headers=headers)
-            with urllib.request.urlopen(req) as response, open(filepath, 'wb') as out_file:
-                out_file.write(response.read())
+            
+            # Download to a partial file, checking between chunks whether the
+            # app is shutting down so the thread can stop promptly
+            partial_path = f"{filepath}.part"
+            try:
+                with urllib.request.urlopen(req, timeout=30) as response, open(partial_path, 'wb') as out_file:
+                    while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                        if self._shutdown_event.is_set():
+                            logger.info(f"Download of {wallpaper.id} cancelled by shutdown")
+                            return
+                        out_file.write(chunk)
+                os.replace(partial_path, filepath)
+            finally:
+                # Never leave a partial file behind; it is gone once replaced
+                try:
+                    os.remove(partial_path)
+                except FileNotFoundError:
+                    pass
             
             # Show success notification
             GLib.idle_add(self.show_download_toast, filepath)
@@ -1911,8 +2215,8 @@ class WSelectorApp(Adw.Application):
             
             # Start the thread to avoid blocking the UI
             threading.Thread(
-                target=self._set_wallpaper_thread,
-                args=(filepath,),
+                target=self._run_tracked,
+                args=(self._set_wallpaper_thread, filepath),
                 daemon=True
             ).start()
             return True
@@ -2869,15 +3173,32 @@ class WSelectorApp(Adw.Application):
         spinner.set_valign(Gtk.Align.CENTER)
         spinner.start()
         
-        # Add spinner to overlay
+        # Create the image now so loading only has to fill it in; content fit
+        # covers the frame while maintaining aspect ratio
+        image = Gtk.Picture()
+        image.set_can_shrink(True)
+        image.set_hexpand(True)
+        image.set_vexpand(True)
+        image.set_content_fit(Gtk.ContentFit.COVER)
+        
+        # Add image and spinner to overlay
+        overlay.set_child(image)
         overlay.add_overlay(spinner)
         
+        # Add click handler to the frame; it does nothing until a filepath is set
+        click_gesture = Gtk.GestureClick()
+        click_gesture.connect("released", self._on_download_thumbnail_clicked)
+        frame.add_controller(click_gesture)
+        
         # Set up the frame
         frame.set_child(overlay)
         box.append(frame)
         
-        # Store index as a property
+        # Store index and parts filled in once the thumbnail loads
         box.index = index
+        box.frame = frame
+        box.picture = image
+        box.spinner = spinner
         flowbox.append(box)
         browser_window.item_count += 1
         return box
@@ -2948,8 +3269,7 @@ class WSelectorApp(Adw.Application):
             filepath, pixbuf, widget, error = future.result()
             
             # Remove from pending
-            if index in browser_window.pending_thumbnails:
-                browser_window.pending_thumbnails.remove(index)
+            browser_window.pending_thumbnails.discard(index)
             
             if error or not pixbuf:
                 logger.warning(f"Failed to load thumbnail for {filepath}: {error}")
@@ -2968,52 +3288,12 @@ class WSelectorApp(Adw.Application):
             logger.error(f"Error in thumbnail callback: {e}")
     
     def _update_thumbnail_widget(self, widget, pixbuf, filename):
-        """Update the widget with the loaded thumbnail"""
-        # Clear existing content
-        while widget.get_first_child():
-            widget.remove(widget.get_first_child())
-        
-        # Main container box
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        box.set_margin_top(6)
-        box.set_margin_bottom(6)
-        box.set_margin_start(6)
-        box.set_margin_end(6)
-        box.set_valign(Gtk.Align.START)
-        
-        # Frame for the image (matches main window)
-        frame = Gtk.Frame()
-        frame.set_hexpand(True)
-        frame.set_vexpand(True)
-        frame.set_size_request(200, 200)
-        
+        """Fill the placeholder widget in with the loaded thumbnail"""
         # Store the filepath in the frame for the click handler
-        frame.filepath = os.path.join(self.get_wallpapers_dir(), filename)
-        
-        # Add click handler to the frame
-        click_gesture = Gtk.GestureClick()
-        click_gesture.connect("released", self._on_download_thumbnail_clicked)
-        frame.add_controller(click_gesture)
-        
-        # Create overlay for the image
-        overlay = Gtk.Overlay()
-        
-        # Create image with content fit to cover the frame while maintaining aspect ratio
-        image = Gtk.Picture.new_for_pixbuf(pixbuf)
-        image.set_can_shrink(True)
-        image.set_hexpand(True)
-        image.set_vexpand(True)
-        image.set_content_fit(Gtk.ContentFit.COVER)
-        
-        # Add image to overlay, and overlay to frame
-        overlay.set_child(image)
-        frame.set_child(overlay)
-        
-        # Add frame to the main container
-        box.append(frame)
-        
-        # Add the container to the widget
-        widget.append(box)
+        widget.frame.filepath = os.path.join(self.get_wallpapers_dir(), filename)
+        widget.picture.set_pixbuf(pixbuf)
+        widget.spinner.stop()
+        widget.spinner.hide()
     
     def _on_download_thumbnail_clicked(self, gesture, n_press, x, y):
         """Handle click on a downloaded thumbnail to show preview"""
@@ -3340,14 +3620,90 @@ class WSelectorApp(Adw.Application):
     def on_window_size_changed(self, widget, param):
         pass
 
+    def _setup_memory_monitoring(self):
+        """Sample memory usage from a main loop timer instead of UI event handlers."""
+        if self._memory_source_id:
+            return
+        self._memory_source_id = GLib.timeout_add_seconds(
+            MEMORY_SAMPLE_INTERVAL, self._sample_memory
+        )
+        
+        # React to real memory pressure reported by the OS
+        try:
+            self._memory_monitor = Gio.MemoryMonitor.dup_default()
+            self._memory_monitor.connect("low-memory-warning", self._on_low_memory_warning)
+        except Exception as e:
+            logger.warning(f"Low memory monitor unavailable: {e}")
+
+    def _on_low_memory_warning(self, monitor, level):
+        """Release caches when the system reports memory pressure."""
+        if level >= Gio.MemoryMonitorWarningLevel.MEDIUM:
+            logger.warning(f"Low memory warning received (level {int(level)}), releasing caches")
+            self.cleanup_resources()
+
+    def cleanup_resources(self):
+        """Drop decoded thumbnails and stale widget references."""
+        self._texture_cache.clear()
+        self._cleanup_wallpaper_widgets()
+        self._maybe_gc()
+
+    def _maybe_gc(self):
+        """Collect the young generation only, and only if enough objects are pending."""
+        if gc.get_count()[0] < GC_MIN_PENDING:
+            return
+        gc.collect(0)
+
+    def _sample_memory(self):
+        """Record an RSS sample and run the throttled memory check."""
+        try:
+            rss = get_rss_mb()
+            self._memory_samples.append((time.monotonic(), rss))
+            if rss > self._memory_peak:
+                self._memory_peak = rss
+            self._memory_sample_count += 1
+            
+            # Emit the recent samples as one log record instead of one per tick
+            if (self._memory_sample_count % MEMORY_LOG_EVERY == 0
+                    and logger.isEnabledFor(logging.DEBUG)):
+                recent = list(self._memory_samples)[-MEMORY_LOG_EVERY:]
+                lines = "".join(MEMORY_SAMPLE_FORMAT % sample for sample in recent)
+                if tracemalloc.is_tracing():
+                    current, peak = tracemalloc.get_traced_memory()
+                    lines += f"\n  traced: {current * BYTES_TO_MB:.1f}MB (peak {peak * BYTES_TO_MB:.1f}MB)"
+                logger.debug(f"Memory samples (peak {self._memory_peak:.1f}MB):{lines}")
+            
+            self._cleanup_wallpaper_widgets()
+            check_memory_usage()
+        except Exception as e:
+            logger.error(f"Error sampling memory usage: {e}")
+        return GLib.SOURCE_CONTINUE
+
     def do_startup(self):
         Adw.StyleManager.get_default().set_color_scheme(Adw.ColorScheme.PREFER_LIGHT)
         Gtk.Application.do_startup(self)
 
+    def _stop_logging(self):
+        """Drain the log queue and flush the handlers."""
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            handler.flush()
+
+    def _join_active_threads(self, timeout):
+        """Wait up to timeout seconds in total for tracked worker threads."""
+        deadline = time.monotonic() + timeout
+        for thread in list(self._active_threads):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            thread.join(remaining)
+        if self._active_threads:
+            logger.debug(f"{len(self._active_threads)} worker thread(s) still running")
+
     def do_shutdown(self):
         """Handle application shutdown with proper cleanup."""
         try:
             logger.info("=== Starting application shutdown sequence ===")
+            self._shutdown_event.set()
             
             # 1. Clear any pending timeouts
             logger.info("Step 1/4: Clearing pending timeouts...")
@@ -3358,6 +3714,12 @@ class WSelectorApp(Adw.Application):
                 except Exception as e:
                     logger.warning(f"Error removing search timeout: {e}")
                 self.search_timeout_id = None
+            if self._memory_source_id:
+                GLib.source_remove(self._memory_source_id)
+                self._memory_source_id = 0
+            if self._config_flush_id:
+                GLib.source_remove(self._config_flush_id)
+                self._flush_config()
 
             # 2. Shutdown executors
             logger.info("Step 2/4: Shutting down executors...")
@@ -3368,6 +3730,15 @@ class WSelectorApp(Adw.Application):
                 except Exception as e:
                     logger.warning(f"Error shutting down executor: {e}")
                 self._executor = None
+            for name in ('_thumb_executor', '_search_executor'):
+                executor = getattr(self, name, None)
+                if executor is not None:
+                    try:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                    except Exception as e:
+                        logger.warning(f"Error shutting down {name}: {e}")
+            self._active_requests.clear()
+            self._join_active_threads(SHUTDOWN_JOIN_TIMEOUT)
 
             # 3. Clean up UI components
             logger.info("Step 3/4: Cleaning up UI components...")
@@ -3417,6 +3788,9 @@ class WSelectorApp(Adw.Application):
 
             logger.info("=== Shutdown completed successfully ===")
             
+            # Flush queued log records before exiting
+            self._stop_logging()
+            
             # Force exit to prevent Python's interpreter from cleaning up GTK objects
             import os
             os._exit(0)
@@ -3430,6 +3804,7 @@ class WSelectorApp(Adw.Application):
             except:
                 pass
             finally:
+                self._stop_logging()
                 # Force exit on error
                 import os
                 os._exit(1)
@@ -4,7 +4,7 @@ import os
 
 CACHE_DIR = os.path.join(GLib.get_user_cache_dir(), "wselector")
 
-@dataclass
+@dataclass(slots=True)
 class WallpaperInfo:
     """Data class for wallpaper information."""
     id: str
@@ -1,450 +1,316 @@
 import os
+import collections
+import hashlib
+import shutil
 import logging
 import gc
 import psutil
 import time
+import threading
 import sys
 import weakref
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from functools import lru_cache
-from wselector.models import WallpaperInfo
+from wselector.models import WallpaperInfo, CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
 # Memory management configuration
 MAX_CACHE_SIZE_MB = 800  # Start cleanup when reaching 800MB (80% of 1GB)
-MEMORY_CHECK_INTERVAL = 30  # Check memory every 30 seconds
-LAST_MEMORY_CHECK = 0
+BYTES_PER_MB = 1 << 20
+MAX_CACHE_SIZE_BYTES = MAX_CACHE_SIZE_MB * BYTES_PER_MB
+MAX_CACHE_FILENAME_LENGTH = 128  # Longer URL basenames are replaced by a digest
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes copied per read when saving a download
+
+# Shared session so thumbnail downloads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+# Bytes in each cache directory as of its last scan plus writes since then
+_CACHE_SIZES: Dict[str, int] = {}
+_CACHE_SIZES_LOCK = threading.Lock()
+_CACHE_SCAN_LOCK = threading.Lock()  # Held by the one thread scanning/evicting
+MEMORY_CHECK_INTERVAL = 30  # Seconds between memory checks
+MEMORY_CHECK_INTERVAL_NS = MEMORY_CHECK_INTERVAL * 1_000_000_000
+MIN_MEMORY_CHECK_INTERVAL_NS = 5 * 1_000_000_000  # Near the limit
+MAX_MEMORY_CHECK_INTERVAL_NS = 300 * 1_000_000_000  # Far below the limit
+_poll_interval_ns = MEMORY_CHECK_INTERVAL_NS  # check_memory_usage's adaptive interval
+LAST_MEMORY_CHECK = 0  # time.monotonic_ns() of the last check
 HIGH_MEMORY_USAGE = False
-LAST_CLEANUP_TIME = 0
+LAST_CLEANUP_TIME = 0  # time.monotonic_ns() of the last cleanup
 MIN_CLEANUP_INTERVAL = 10  # Minimum seconds between cleanups
+MIN_CLEANUP_INTERVAL_NS = MIN_CLEANUP_INTERVAL * 1_000_000_000
+LAST_COLLECT_TIME = 0  # time.monotonic_ns() of the last force_deep_gc
+LAST_FULL_CLEANUP_TIME = 0  # time.monotonic_ns() of the last _do_cleanup
+MIN_FULL_CLEANUP_INTERVAL_NS = 1_000_000_000  # Back-to-back cleanups within 1s are skipped
+MIN_COLLECT_INTERVAL = 5  # Minimum seconds between forced collections
+MIN_COLLECT_INTERVAL_NS = MIN_COLLECT_INTERVAL * 1_000_000_000
 MAX_MEMORY_USAGE_MB = 1000  # Hard cap at 1GB
 FORCE_GC_THRESHOLD = 0.8  # Start cleanup at 80% of max (800MB)
 
 # Track memory usage history for leak detection
-MEMORY_HISTORY = []
 MAX_HISTORY_LENGTH = 10
+MEMORY_HISTORY = collections.deque(maxlen=MAX_HISTORY_LENGTH)
 
-def get_memory_usage() -> Tuple[float, float]:
-    """Get current memory usage in MB and percentage."""
-    process = psutil.Process()
-    mem_info = process.memory_info()
-    return mem_info.rss / (1024 * 1024), process.memory_percent()
+# Handle to this process, reused so each sample doesn't build a new one
+_PROCESS = psutil.Process(os.getpid())
+BYTES_TO_MB = 1.0 / BYTES_PER_MB
 
-def log_memory_usage(prefix: str = ""):
-    """Log current memory usage with an optional prefix."""
-    mb_used, percent = get_memory_usage()
-    logging.info(f"{prefix}Memory usage: {mb_used:.2f}MB ({percent:.1f}%)")
-    return mb_used
-
-def clear_function_caches():
-    """Clear Python function caches."""
-    # Clear lru_caches
-    for obj in gc.get_objects():
-        try:
-            if callable(obj) and hasattr(obj, 'cache_info'):
-                obj.cache_info()  # This will create the cache if it doesn't exist
-                if hasattr(obj, 'cache_clear') and callable(getattr(obj, 'cache_clear', None)):
-                    try:
-                        obj.cache_clear()
-                    except Exception as e:
-                        logging.debug(f"Could not clear cache for {obj.__name__ if hasattr(obj, '__name__') else 'object'}: {e}")
-        except Exception as e:
-            logging.debug(f"Error clearing cache for object: {e}")
+# On Linux, RSS is read straight from a cached /proc/self/statm descriptor
+try:
+    _STATM_FD = os.open('/proc/self/statm', os.O_RDONLY) if sys.platform == 'linux' else None
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except OSError:
+    _STATM_FD = None
 
-def clear_image_caches():
-    """Clear all image-related caches."""
-    try:
-        from gi.repository import GdkPixbuf, Gio
-        
-        # Clear GdkPixbuf's internal cache
-        if hasattr(GdkPixbuf.Pixbuf, 'clear_cache'):
-            GdkPixbuf.Pixbuf.clear_cache()
-            
-        # Clear GIO's file info cache
-        if hasattr(Gio, 'FileInfo'):
-            Gio.FileInfo.clear_cache()
-            
-        # Clear any custom image caches
-        for module in list(sys.modules.values()):
-            if hasattr(module, '__file__') and 'PIL' in str(module.__file__):
-                try:
-                    if hasattr(module, 'Image'):
-                        # Clear PIL image cache if it exists
-                        if hasattr(module.Image, '_show'):
-                            module.Image._show.cache_clear()
-                except:
-                    pass
-    except Exception as e:
-        logging.debug(f"Error clearing image caches: {e}")
-
-def clear_gtk_caches():
-    """Clear GTK's internal caches more aggressively."""
-    try:
-        # Clear style context cache
-        if 'Gtk' in globals():
-            style_context = Gtk.StyleContext()
-            style_context.invalidate()
-            
-            # Clear style property cache
-            Gtk.Widget.reset_style()
-            
-            # Clear icon theme cache
-            icon_theme = Gtk.IconTheme.get_default()
-            icon_theme.rescan_if_needed()
-            
-            # Clear Gdk caches
-            if 'Gdk' in globals():
-                display = Gdk.Display.get_default()
-                if display:
-                    display.sync()
-                    display.flush()
-                    
-    except Exception as e:
-        logger.warning(f"Error clearing GTK caches: {e}")
+# Last RSS reading as (bytes, time.monotonic_ns()), shared by all callers
+_LAST_RSS = (0, 0)
+RSS_MAX_AGE_NS = 100_000_000  # Readings younger than 100ms may be reused
 
-def clear_module_caches():
-    """Clear module-level caches while preserving essential built-ins."""
-    try:
-        import sys
-        import builtins
-        
-        # List of builtins we should never clear
-        SAFE_BUILTINS = {
-            'hasattr', 'getattr', 'setattr', 'delattr',
-            'Exception', 'BaseException', 'TypeError', 'ValueError',
-            'isinstance', 'issubclass', 'type', 'object',
-            'str', 'int', 'float', 'bool', 'list', 'dict', 'tuple', 'set',
-            'len', 'next', 'iter', 'callable', 'property', 'staticmethod',
-            'classmethod', 'super', 'enumerate', 'range', 'zip', 'map', 'filter',
-            'any', 'all', 'sum', 'min', 'max', 'abs', 'round', 'divmod', 'pow',
-            'sorted', 'reversed', 'slice', 'memoryview', 'bytearray', 'bytes',
-            'chr', 'ord', 'bin', 'hex', 'oct', 'ascii', 'format', 'vars', 'dir',
-            'globals', 'locals', 'hash', 'id', 'isinstance', 'issubclass',
-            'issubclass', 'callable', 'classmethod', 'staticmethod', 'property',
-            'object', 'type', 'super', 'int', 'float', 'bool', 'complex', 'str',
-            'list', 'tuple', 'dict', 'set', 'frozenset', 'bytearray', 'bytes',
-            'memoryview', 'slice', 'range', 'enumerate', 'zip', 'reversed',
-            'sorted', 'filter', 'map', 'iter', 'next', 'callable', 'hash', 'id',
-            'isinstance', 'issubclass', 'getattr', 'setattr', 'delattr',
-            'hasattr', 'property', 'classmethod', 'staticmethod', 'super'
-        }
-        
-        for module_name, module in list(sys.modules.items()):
-            try:
-                # Skip builtins and essential modules
-                if module_name in ('builtins', 'sys', 'gc', 'logging'):
-                    continue
-                    
-                if hasattr(module, '__dict__'):
-                    for attr_name in dir(module):
-                        try:
-                            # Skip special attributes and safe builtins
-                            if attr_name.startswith('__') and attr_name.endswith('__'):
-                                continue
-                                
-                            if attr_name in SAFE_BUILTINS:
-                                continue
-                                
-                            obj = getattr(module, attr_name, None)
-                            if (hasattr(obj, 'cache_clear') and 
-                                callable(obj.cache_clear) and 
-                                not isinstance(obj, type)):  # Don't clear class methods
-                                obj.cache_clear()
-                        except Exception as e:
-                            logging.debug(f"Error clearing {module_name}.{attr_name}: {e}")
-            except Exception as e:
-                logging.debug(f"Error processing module {module_name}: {e}")
-    except Exception as e:
-        logging.debug(f"Error in clear_module_caches: {e}")
+def _get_rss_bytes(max_age_ns: int = 0) -> int:
+    """Get the resident set size of this process in bytes.
+    
+    A reading taken less than max_age_ns ago is returned without touching
+    /proc again.
+    """
+    global _LAST_RSS
+    
+    now = time.monotonic_ns()
+    rss, taken_at = _LAST_RSS
+    if max_age_ns and now - taken_at < max_age_ns:
+        return rss
+    
+    if _STATM_FD is not None:
+        # Fields are "size resident shared ..." in pages; pread needs no seek
+        rss = int(os.pread(_STATM_FD, 128, 0).split(b' ', 2)[1]) * _PAGE_SIZE
+    else:
+        rss = _PROCESS.memory_info().rss
+    _LAST_RSS = (rss, now)
+    return rss
 
-def clear_network_caches():
-    """Clear network-related caches."""
-    try:
-        import requests
-        import http.client
-        import urllib3
-        
-        # Clear requests session cache
-        if hasattr(requests.Session, 'cache'):
-            requests.Session.cache.clear()
-            
-        # Clear connection pools
-        try:
-            http.client.HTTPConnection._clear_cache()
-        except:
-            pass
-            
-        # Clear urllib3 connection pools
-        try:
-            urllib3.util.connection.HTTPConnection._clear_cache()
-        except:
-            pass
-            
-        # Clear DNS cache
-        try:
-            import socket
-            socket.gethostbyname.cache_clear()
-        except:
-            pass
-            
-    except Exception as e:
-        logging.debug(f"Error clearing network caches: {e}")
+def get_rss_mb(max_age_ns: int = 0) -> float:
+    """Get the resident set size of this process in MB."""
+    return _get_rss_bytes(max_age_ns) * BYTES_TO_MB
 
 def clear_python_caches():
     """Clear Python's internal caches."""
     try:
-        import sys
-        import types
-        
-        # Clear function caches
-        for module in list(sys.modules.values()):
-            if not isinstance(module, types.ModuleType):
-                continue
-                
-            for attr_name in dir(module):
-                try:
-                    attr = getattr(module, attr_name)
-                    if hasattr(attr, 'cache_clear'):
-                        attr.cache_clear()
-                except:
-                    pass
-                    
         # Clear import caches
         sys.path_importer_cache.clear()
-        if hasattr(sys, 'path_importer_cache'):
-            sys.path_importer_cache.clear()
             
         # Clear type caches
         if hasattr(sys, '_clear_type_cache'):
             sys._clear_type_cache()
             
     except Exception as e:
-        logging.debug(f"Error clearing Python caches: {e}")
+        logger.debug("Error clearing Python caches: %s", e)
 
 def force_deep_gc():
-    """Force deep garbage collection and clear cyclic references."""
+    """Collect garbage in stages, escalating only while memory stays high.
+    
+    Runs at most once per MIN_COLLECT_INTERVAL; a full collection walks the
+    whole heap, so the young generations are tried first.
+    """
+    global LAST_COLLECT_TIME
+    
+    current_time = time.monotonic_ns()
+    if current_time - LAST_COLLECT_TIME < MIN_COLLECT_INTERVAL_NS:
+        return
+    LAST_COLLECT_TIME = current_time
+    
     try:
-        # Clear garbage collector's internal caches
-        gc.set_debug(gc.DEBUG_SAVEALL)
-        
-        # Run multiple collection passes
-        for gen in range(2, -1, -1):
+        for gen in range(3):
             gc.collect(gen)
-            time.sleep(0.1)
-            
-        # Clear any remaining garbage
-        gc.collect()
-        
-        # Clear debug flags
-        gc.set_debug(0)
+            if get_rss_mb() <= MAX_CACHE_SIZE_MB:
+                break
         
     except Exception as e:
-        logger.warning(f"Error in force_deep_gc: {e}")
+        logger.warning("Error in force_deep_gc: %s", e)
 
-def clear_all_caches():
-    """Clear all possible caches."""
-    clear_image_caches()
-    clear_gtk_caches()
-    clear_network_caches()
-    clear_python_caches()
+def _do_cleanup(reason: str, emergency: bool = False) -> float:
+    """Clear Python's internal caches and run one full garbage collection.
     
-    # Force garbage collection
-    import gc
-    for gen in range(2, -1, -1):
-        gc.collect(gen)
-
-def clear_emergency():
-    """Emergency memory cleanup - most aggressive measures."""
+    reason labels the log messages; emergency raises them to warning level.
+    Returns memory usage in MB afterwards, or -1 on error. A call within
+    MIN_FULL_CLEANUP_INTERVAL of the previous one only reports usage, so
+    cleanups triggered back to back under memory pressure don't repeat
+    the work.
+    """
+    global LAST_FULL_CLEANUP_TIME
+    
+    log = logger.warning if emergency else logger.info
     try:
-        logger.warning("Initiating emergency memory cleanup")
-        
-        # Clear all caches
-        clear_image_caches()
-        clear_gtk_caches()
-        clear_network_caches()
-        clear_module_caches()
+        current_time = time.monotonic_ns()
+        if current_time - LAST_FULL_CLEANUP_TIME < MIN_FULL_CLEANUP_INTERVAL_NS:
+            return get_rss_mb(RSS_MAX_AGE_NS)
+        LAST_FULL_CLEANUP_TIME = current_time
         
-        # Force deep garbage collection
-        force_deep_gc()
-        
-        # Clear GTK caches more aggressively
-        if 'Gdk' in globals():
-            Gdk.ffi.gc()
-            
-        # Clear pixbuf loader caches
-        if 'GdkPixbuf' in globals():
-            GdkPixbuf.Pixbuf.get_formats()
-            
-        # Clear any remaining references
-        import sys
-        modules_to_clear = [
-            'PIL', 'PIL.Image', 'PIL.ImageFile', 
-            'urllib3', 'requests', 'http', 'urllib', 'urllib.parse',
-            'gi.overrides', 'gi.repository', 'gi._gi', 'gi._error',
-            'gi.module', 'gi.types', 'gi._constants', 'gi._gi_cairo',
-            'gi._option', 'gi._propertyhelper', 'gi._signalhelper',
-            'gi._gtktemplate', 'gi.docstring', 'gi.importer', 'gi.types'
-        ]
+        log("Initiating %s memory cleanup", reason)
+        clear_python_caches()
         
-        for mod in modules_to_clear:
-            if mod in sys.modules:
-                try:
-                    del sys.modules[mod]
-                except Exception as e:
-                    logger.debug(f"Could not clear module {mod}: {e}")
-        
-        # Force another GC
+        # One full collection reaches every cyclic reference; repeating it
+        # only walks the heap again
         gc.collect()
         
-        # Get final memory usage
-        process = psutil.Process()
-        mem_info = process.memory_info()
-        mb_used = mem_info.rss / (1024 * 1024)
-        logger.warning(f"After emergency cleanup: {mb_used:.2f}MB")
-        
+        mb_used = get_rss_mb()
+        log("After %s cleanup: Memory usage: %.2fMB", reason, mb_used)
         return mb_used
         
     except Exception as e:
-        logger.error(f"Error during emergency cleanup: {e}")
+        logger.error("Error during memory cleanup: %s", e)
         return -1
 
+def clear_all_caches():
+    """Clear Python's internal caches and run a full garbage collection."""
+    _do_cleanup("cache")
+
+def clear_emergency():
+    """Run the shared cleanup when memory is critically high.
+    
+    Does the same work as manual_cleanup but logs at warning level.
+    Returns memory usage in MB afterwards, or -1 on error.
+    """
+    return _do_cleanup("emergency", emergency=True)
+
 def manual_cleanup():
     """
-    Perform a thorough memory cleanup that can be triggered manually.
-    More aggressive than regular cleanup but safer than emergency cleanup.
+    Run the shared cleanup on user request.
+    Returns True if it completed without error.
     """
-    try:
-        logger.info("Initiating manual memory cleanup...")
-        
-        # First, clear all caches
-        clear_image_caches()
-        clear_gtk_caches()
-        clear_network_caches()
-        clear_module_caches()
-        
-        # Force garbage collection multiple times to collect cyclic references
-        for _ in range(3):
-            gc.collect()
-            time.sleep(0.1)  # Give GC time to work
-            
-        # Clear any remaining caches
-        if 'gc' in globals():
-            gc.collect()
-            
-        # Clear any remaining GTK caches
-        if 'Gdk' in globals():
-            Gdk.ffi.gc()
-            
-        # Clear pixbuf caches
-        if 'GdkPixbuf' in globals():
-            GdkPixbuf.Pixbuf.get_formats()  # This can help clear pixbuf cache
-            
-        # Clear any remaining references
-        import sys
-        if 'sys' in globals():
-            # Clear modules that might be holding references
-            modules_to_clear = ['PIL', 'PIL.Image', 'PIL.ImageFile', 'urllib3', 'requests']
-            for mod in modules_to_clear:
-                if mod in sys.modules:
-                    try:
-                        del sys.modules[mod]
-                    except Exception as e:
-                        logger.debug(f"Could not clear module {mod}: {e}")
-        
-        # Get final memory usage
-        process = psutil.Process()
-        mem_info = process.memory_info()
-        mb_used = mem_info.rss / (1024 * 1024)
-        logger.info(f"After manual cleanup: Memory usage: {mb_used:.2f}MB")
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error during manual cleanup: {e}")
-        return False
+    return _do_cleanup("manual") >= 0
 
 def get_cached_thumbnail_path(url: str, cache_dir: str) -> Optional[str]:
     """Get or download a thumbnail with caching."""
     try:
-        # Create cache directory if it doesn't exist
+        # Create cache directory if it doesn't exist; not memoized, since the
+        # directory may be deleted while the app is running
         os.makedirs(cache_dir, exist_ok=True)
         
-        # Get filename from URL
+        # Get filename from URL; fall back to a digest that is stable across
+        # runs (hash() is randomized per process) and bounded in length
         filename = os.path.basename(urlparse(url).path)
-        if not filename:
-            filename = f"thumbnail_{hash(url)}.jpg"
+        if not filename or len(filename) > MAX_CACHE_FILENAME_LENGTH:
+            digest = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+            filename = f"thumbnail_{digest}.jpg"
             
         cache_path = os.path.join(cache_dir, filename)
         if os.path.exists(cache_path):
             return cache_path
             
-        # Download the image with timeout
-        response = requests.get(url, stream=True, timeout=10)
-        response.raise_for_status()
-        
-        # Save the image in chunks
-        with open(cache_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if not chunk:  # Filter out keep-alive chunks
-                    continue
-                f.write(chunk)
+        # Write to a temporary file and rename it into place, so other
+        # threads never see a partially written thumbnail
+        temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            # Stream the image with timeout; copyfileobj copies in 64KB
+            # chunks, which covers a typical thumbnail in a single write()
+            with _SESSION.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(temp_path, 'wb', buffering=0) as f:
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+                    size = f.tell()
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
         
         # Check cache size and clean up if needed
-        cleanup_cache(cache_dir, max_size_mb=MAX_CACHE_SIZE_MB)
+        _record_cache_write(cache_dir, size, MAX_CACHE_SIZE_MB)
         
         return cache_path
         
     except Exception as e:
-        logging.error(f"Failed to download thumbnail {url}: {e}")
+        logger.error("Failed to download thumbnail %s: %s", url, e)
         return None
 
+def _record_cache_write(cache_dir: str, size: int, max_size_mb: int):
+    """Account for a newly written cache file, scanning only once over the limit."""
+    with _CACHE_SIZES_LOCK:
+        total = _CACHE_SIZES.get(cache_dir)
+        if total is not None:
+            total += size
+            _CACHE_SIZES[cache_dir] = total
+            if total <= max_size_mb * BYTES_PER_MB:
+                return
+        else:
+            # Seed the entry so concurrent first writers don't each start
+            # a scan; the scan below replaces it with the real total
+            _CACHE_SIZES[cache_dir] = size
+    cleanup_cache(cache_dir, max_size_mb)
+
+def _scan_cache(path: str):
+    """Yield (path, atime, size) for every file below path."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_cache(entry.path)
+                else:
+                    stat = entry.stat(follow_symlinks=False)
+                    yield entry.path, stat.st_atime, stat.st_size
+            except OSError:
+                continue
+
 def cleanup_cache(cache_dir: str, max_size_mb: int):
-    """Clean up cache directory if it exceeds max_size_mb."""
+    """Clean up cache directory if it exceeds max_size_mb.
+    
+    Only one thread scans and evicts at a time; a call made while another
+    is running returns at once, since that pass covers its file too.
+    """
+    if not _CACHE_SCAN_LOCK.acquire(blocking=False):
+        return
     try:
-        if not os.path.exists(cache_dir):
-            return
-            
         # Get all files with their access times and sizes
-        files = []
-        total_size = 0
-        
-        for root, _, filenames in os.walk(cache_dir):
-            for filename in filenames:
-                filepath = os.path.join(root, filename)
-                try:
-                    stat = os.stat(filepath)
-                    files.append((filepath, stat.st_atime, stat.st_size))
-                    total_size += stat.st_size
-                except OSError:
-                    continue
-        
-        # Convert to MB
-        total_size_mb = total_size / (1024 * 1024)
+        try:
+            files = list(_scan_cache(cache_dir))
+        except FileNotFoundError:
+            return
+        total_size = sum(size for _, _, size in files)
+        max_size = max_size_mb * BYTES_PER_MB
         
         # If under limit, do nothing
-        if total_size_mb <= max_size_mb:
+        if total_size <= max_size:
+            with _CACHE_SIZES_LOCK:
+                _CACHE_SIZES[cache_dir] = total_size
             return
             
         # Sort files by access time (oldest first)
         files.sort(key=lambda x: x[1])
         
         # Remove oldest files until under limit
+        target_size = max_size * 9 // 10  # Stop at 90% of max size
+        remove = os.remove  # Bound once; the loop may visit thousands of files
         for filepath, _, size in files:
-            if total_size_mb <= max_size_mb * 0.9:  # Stop at 90% of max size
+            if total_size <= target_size:
                 break
                 
             try:
-                os.remove(filepath)
-                total_size_mb -= size / (1024 * 1024)
+                remove(filepath)
+            except FileNotFoundError:
+                pass  # Already gone; it no longer counts either way
             except OSError:
                 continue
+            total_size -= size
+        
+        with _CACHE_SIZES_LOCK:
+            _CACHE_SIZES[cache_dir] = total_size
                 
     except Exception as e:
-        logging.error(f"Error cleaning up cache: {e}")
+        logger.error("Error cleaning up cache: %s", e)
+    finally:
+        _CACHE_SCAN_LOCK.release()
 
 def download_thumbnail(wp: WallpaperInfo) -> str:
     """
@@ -457,52 +323,42 @@ def download_thumbnail(wp: WallpaperInfo) -> str:
         str: Path to the downloaded thumbnail file
     """
     try:
-        check_memory_usage()
-        cache_dir = os.path.dirname(wp.get_cached_path())
-        return get_cached_thumbnail_path(wp.thumbnail_url, cache_dir)
+        # Memory checks run on the app's periodic sampler, not per thumbnail
+        return get_cached_thumbnail_path(wp.thumbnail_url, CACHE_DIR)
         
     except Exception as e:
-        logger.error(f"Failed to download thumbnail for {wp.id}: {e}")
+        logger.error("Failed to download thumbnail for %s: %s", wp.id, e)
         raise
 
 def track_memory_usage():
     """Track memory usage history and detect potential leaks."""
-    global MEMORY_HISTORY, LAST_MEMORY_CHECK, LAST_CLEANUP_TIME
+    global LAST_MEMORY_CHECK, LAST_CLEANUP_TIME
     
     try:
-        import time
-        import psutil
-        
-        current_time = time.time()
-        if current_time - LAST_MEMORY_CHECK < MEMORY_CHECK_INTERVAL:
+        current_time = time.monotonic_ns()
+        if current_time - LAST_MEMORY_CHECK < MEMORY_CHECK_INTERVAL_NS:
             return
             
         # Get current memory usage
-        process = psutil.Process()
-        mem_info = process.memory_info()
-        mb_used = mem_info.rss / (1024 * 1024)
+        mb_used = get_rss_mb()
         
-        # Add to history
+        # Add to history; the deque drops the oldest entry itself
         MEMORY_HISTORY.append((current_time, mb_used))
-        
-        # Keep only the last MAX_HISTORY_LENGTH entries
-        if len(MEMORY_HISTORY) > MAX_HISTORY_LENGTH:
-            MEMORY_HISTORY = MEMORY_HISTORY[-MAX_HISTORY_LENGTH:]
             
         # Check for memory leaks (significant growth over time)
-        if len(MEMORY_HISTORY) >= 10:  # Need at least 10 data points
+        if len(MEMORY_HISTORY) == MAX_HISTORY_LENGTH:  # Need a full history
             oldest = MEMORY_HISTORY[0][1]
             newest = MEMORY_HISTORY[-1][1]
             growth = newest - oldest
             
             if growth > 100:  # More than 100MB growth
-                logging.warning(f"Possible memory leak detected: {growth:.2f}MB growth in last {len(MEMORY_HISTORY)} checks")
+                logger.warning("Possible memory leak detected: %.2fMB growth in last %d checks", growth, len(MEMORY_HISTORY))
                 
         # Update last check time
         LAST_MEMORY_CHECK = current_time
         
     except Exception as e:
-        logging.debug(f"Error tracking memory usage: {e}")
+        logger.debug("Error tracking memory usage: %s", e)
     
     # Update last cleanup time if needed
     try:
@@ -512,98 +368,65 @@ def track_memory_usage():
 
 def check_memory_usage():
     """Check if memory usage is too high and perform cleanup if needed."""
-    global LAST_MEMORY_CHECK, HIGH_MEMORY_USAGE, LAST_CLEANUP_TIME
+    global LAST_MEMORY_CHECK, HIGH_MEMORY_USAGE, LAST_CLEANUP_TIME, _poll_interval_ns
     
     try:
-        current_time = time.time()
-        if current_time - LAST_MEMORY_CHECK < MEMORY_CHECK_INTERVAL:
+        current_time = time.monotonic_ns()
+        if current_time - LAST_MEMORY_CHECK < _poll_interval_ns:
             return
             
-        process = psutil.Process()
-        mem_info = process.memory_info()
-        mb_used = mem_info.rss / (1024 * 1024)
+        # The app's sampler usually read RSS a moment ago
+        rss = _get_rss_bytes(RSS_MAX_AGE_NS)
         
         # Update last check time
         LAST_MEMORY_CHECK = current_time
         
-        if HIGH_MEMORY_USAGE or mb_used > MAX_CACHE_SIZE_MB:
-            if current_time - LAST_CLEANUP_TIME < MIN_CLEANUP_INTERVAL:
+        # Back off while usage is below 50% of the limit, tighten above 70%
+        if rss * 2 < MAX_CACHE_SIZE_BYTES:
+            _poll_interval_ns = min(_poll_interval_ns * 2, MAX_MEMORY_CHECK_INTERVAL_NS)
+        elif rss * 10 > MAX_CACHE_SIZE_BYTES * 7:
+            _poll_interval_ns = max(_poll_interval_ns // 2, MIN_MEMORY_CHECK_INTERVAL_NS)
+        
+        if HIGH_MEMORY_USAGE or rss > MAX_CACHE_SIZE_BYTES:
+            if current_time - LAST_CLEANUP_TIME < MIN_CLEANUP_INTERVAL_NS:
                 return
+            mb_used = rss * BYTES_TO_MB
                 
             if not HIGH_MEMORY_USAGE:
-                try:
-                    logging.warning(f"Memory usage high: {mb_used:.2f}MB, performing cleanup...")
-                except:
-                    pass
+                logger.warning("Memory usage high: %.2fMB, performing cleanup...", mb_used)
                 HIGH_MEMORY_USAGE = True
             
             # Perform cleanup with error handling
             try:
                 force_deep_gc()
-                clear_image_caches()
-                clear_gtk_caches()
-                clear_module_caches()
-                clear_network_caches()
+                clear_python_caches()
             except Exception as e:
-                try:
-                    logging.debug(f"Error during cleanup: {e}")
-                except:
-                    pass
+                logger.debug("Error during cleanup: %s", e)
             
             # Get new memory usage
             new_mb = mb_used  # Default to old value if we can't get new one
             try:
-                new_mb = process.memory_info().rss / (1024 * 1024)
-                try:
-                    logging.info(f"After cleanup: Memory usage: {new_mb:.2f}MB")
-                except:
-                    pass
+                new_mb = get_rss_mb()
+                logger.info("After cleanup: Memory usage: %.2fMB", new_mb)
                     
                 # Emergency measures if still too high
                 if new_mb > MAX_MEMORY_USAGE_MB:
-                    try:
-                        logging.warning("Memory critically high, performing emergency cleanup...")
-                        clear_emergency()
-                        new_mb = process.memory_info().rss / (1024 * 1024)
-                        try:
-                            logging.warning(f"After emergency cleanup: {new_mb:.2f}MB")
-                        except:
-                            pass
-                    except Exception as e:
-                        try:
-                            logging.debug(f"Error during emergency cleanup: {e}")
-                        except:
-                            pass
+                    logger.warning("Memory critically high, performing emergency cleanup...")
+                    clear_emergency()
+                    new_mb = get_rss_mb()
+                    logger.warning("After emergency cleanup: %.2fMB", new_mb)
             except Exception as e:
-                try:
-                    logging.debug(f"Error checking memory after cleanup: {e}")
-                except:
-                    pass
+                logger.debug("Error checking memory after cleanup: %s", e)
             
             # Update state
-            try:
-                HIGH_MEMORY_USAGE = new_mb > MAX_CACHE_SIZE_MB * 0.8
-                if not HIGH_MEMORY_USAGE:
-                    try:
-                        logging.info("Memory usage normalized")
-                    except:
-                        pass
-                elif new_mb > MAX_MEMORY_USAGE_MB * 1.1:  # 10% over absolute max
-                    try:
-                        logging.error("Memory critically high, consider restarting the application")
-                    except:
-                        pass
-            except Exception as e:
-                try:
-                    logging.debug(f"Error updating memory state: {e}")
-                except:
-                    pass
+            HIGH_MEMORY_USAGE = new_mb > MAX_CACHE_SIZE_MB * 0.8
+            if not HIGH_MEMORY_USAGE:
+                logger.info("Memory usage normalized")
+            elif new_mb > MAX_MEMORY_USAGE_MB * 1.1:  # 10% over absolute max
+                logger.error("Memory critically high, consider restarting the application")
             
             # Update last cleanup time
             LAST_CLEANUP_TIME = current_time
             
     except Exception as e:
-        try:
-            logging.debug(f"Error in check_memory_usage: {e}")
-        except:
-            pass
\ No newline at end of file
+        logger.debug("Error in check_memory_usage: %s", e)
\ No newline at end of file